@@ -6,12 +6,28 @@ from typing import Optional
 from typing import Set
 
 
+def _attributes(obj: Any) -> Dict[str, Any]:
+    """All attributes of an object, be they stored in ``__slots__`` or in ``__dict__``."""
+    attributes = {
+        name: getattr(obj, name)
+        for cls in type(obj).__mro__
+        for name in getattr(cls, "__slots__", ())
+        if hasattr(obj, name)
+    }
+    attributes.update(getattr(obj, "__dict__", {}))
+    return attributes
+
+
 class Block(abc.ABC):
     """A abstract superclass of all top-level building blocks of a bibtex file.
 
     E.g. a ``@string`` block, a ``@preamble`` block, an ``@entry`` block, a comment, etc.
     """
 
+    # Parsing creates many model instances, hence we use slots
+    #   to reduce their memory footprint and speed up attribute access.
+    __slots__ = ("_start_line_in_file", "_raw", "_parser_metadata")
+
     def __init__(
         self,
         start_line: Optional[int] = None,
@@ -67,18 +83,23 @@ class Block(abc.ABC):
         See attribute ``parser_metadata`` for more information."""
         self._parser_metadata[key] = value
 
+    def __getstate__(self):
+        return None, _attributes(self)
+
     def __eq__(self, other):
         # make sure they have the same type and same content
         return (
             isinstance(other, self.__class__)
             and isinstance(self, other.__class__)
-            and self.__dict__ == other.__dict__
+            and _attributes(self) == _attributes(other)
         )
 
 
 class String(Block):
     """Bibtex Blocks of the ``@string`` type, e.g. ``@string{me = "My Name"}``."""
 
+    __slots__ = ("_key", "_value")
+
     def __init__(
         self,
         key: str,
@@ -121,6 +142,8 @@ class String(Block):
 class Preamble(Block):
     """Bibtex Blocks of the ``@preamble`` type, e.g. ``@preamble{This is a preamble}``."""
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: str, start_line: Optional[int] = None, raw: Optional[str] = None):
         super().__init__(start_line, raw)
         self._value = value
@@ -144,6 +167,8 @@ class Preamble(Block):
 class ExplicitComment(Block):
     """Bibtex Blocks of the ``@comment`` type, e.g. ``@comment{This is a comment}``."""
 
+    __slots__ = ("_comment",)
+
     def __init__(self, comment: str, start_line: Optional[int] = None, raw: Optional[str] = None):
         super().__init__(start_line, raw)
         self._comment = comment
@@ -170,6 +195,8 @@ class ExplicitComment(Block):
 class ImplicitComment(Block):
     """Bibtex outside of an ``@{...}`` block, which is treated as a comment."""
 
+    __slots__ = ("_comment",)
+
     def __init__(self, comment: str, start_line: Optional[int] = None, raw: Optional[str] = None):
         super().__init__(start_line, raw)
         self._comment = comment
@@ -196,6 +223,8 @@ class ImplicitComment(Block):
 class Field:
     """A field of a Bibtex entry, e.g. ``author = {John Doe}``."""
 
+    __slots__ = ("_start_line", "_key", "_value")
+
     def __init__(self, key: str, value: Any, start_line: Optional[int] = None):
         self._start_line = start_line
         self._key = key
@@ -224,12 +253,15 @@ class Field:
         """The line number of the first line of this field in the originally parsed string."""
         return self._start_line
 
+    def __getstate__(self):
+        return None, _attributes(self)
+
     def __eq__(self, other):
         # make sure they have the same type and same content
         return (
             isinstance(other, self.__class__)
             and isinstance(self, other.__class__)
-            and self.__dict__ == other.__dict__
+            and _attributes(self) == _attributes(other)
         )
 
     def __str__(self):
@@ -242,6 +274,8 @@ class Field:
 class Entry(Block):
     """Bibtex Blocks of the ``@entry`` type, e.g. ``@article{Cesar2013, ...}``."""
 
+    __slots__ = ("_entry_type", "_key", "_fields")
+
     def __init__(
         self,
         entry_type: str,
@@ -291,11 +325,11 @@ class Entry(Block):
 
     def set_field(self, field: Field):
         """Adds a new field, or replaces existing with same key."""
-        if field.key in self.fields_dict:
-            i = [f.key for f in self._fields].index(field.key)
-            self._fields[i] = field
-        else:
-            self._fields.append(field)
+        for i, f in enumerate(self._fields):
+            if f.key == field.key:
+                self._fields[i] = field
+                return
+        self._fields.append(field)
 
     def pop(self, key: str, default=None) -> Optional[Field]:
         """Removes and returns the field with the given key.
@@ -376,6 +410,8 @@ class Entry(Block):
 class ParsingFailedBlock(Block):
     """A block that could not be parsed due to some raised exception."""
 
+    __slots__ = ("_error", "_ignore_error_block")
+
     def __init__(
         self,
         error: Exception,
@@ -408,6 +444,8 @@ class MiddlewareErrorBlock(ParsingFailedBlock):
     To get the block that caused this error, call `block.ignore_error_block`
     (which is the block with the middleware not or only partially applied)."""
 
+    __slots__ = ()
+
     def __init__(self, block: Block, error: Exception):
         super().__init__(
             start_line=block.start_line,
@@ -422,6 +460,8 @@ class DuplicateBlockKeyBlock(ParsingFailedBlock):
 
     To get the block that caused this error, call `block.ignore_error_block`."""
 
+    __slots__ = ("_key", "_previous_block")
+
     def __init__(
         self,
         key: str,
@@ -457,6 +497,8 @@ class DuplicateBlockKeyBlock(ParsingFailedBlock):
 class DuplicateFieldKeyBlock(ParsingFailedBlock):
     """An error-indicating block indicating a duplicate field key in an entry."""
 
+    __slots__ = ("_duplicate_keys",)
+
     def __init__(self, duplicate_keys: Set[str], entry: Entry):
         sorted_duplicate_keys = sorted(list(duplicate_keys))
         super().__init__(
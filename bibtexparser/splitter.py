@@ -21,6 +21,56 @@ from .model import String
 
 logger = logging.getLogger(__name__)
 
+# Marks are the special characters the splitter is interested in:
+#   Non-escaped `{`, `}`, `"`, `,`, `=`, as well as block starts (e.g. `@article{`).
+#   The pattern deliberately starts with a character set (and only then checks
+#   the escaping and the block start), which allows `re` to quickly skip
+#   over all characters that cannot start a mark.
+_MARK_RE = re.compile(r"[{}\",=@](?:(?<=@)\w*[ \t]*(?={)|(?<!@)(?<!\\.))")
+
+# Block start, e.g. `@article ` (followed by `{`), matching the corresponding marks
+_BLOCK_START_RE = re.compile(r"@\w*[ \t]*(?={)")
+
+# A mark is represented as a `(value, start_index, end_index)` tuple,
+#   e.g. `("@article", 12, 20)` or `("=", 31, 32)`.
+_Mark = Tuple[str, int, int]
+
+# Block types which are not entries, mapped to the name of the `Splitter` method handling them.
+#   Any other block type is handled as an entry.
+_BLOCK_HANDLERS = {
+    "comment": "_handle_explicit_comment",
+    "preamble": "_handle_preamble",
+    "string": "_handle_string",
+}
+
+
+def _find(s: str, sub: str, start: int) -> int:
+    """Like ``s.find(sub, start)``, but returns ``len(s)`` instead of ``-1`` if not found."""
+    index = s.find(sub, start)
+    return len(s) if index == -1 else index
+
+
+class _MarkScanner:
+    """Position-based scanner over the marks (special characters) of a bibtex string.
+
+    In contrast to ``re.finditer``, the scanner keeps an explicit position,
+    which can be inspected and moved forward by the splitter."""
+
+    __slots__ = ("bibstr", "pos", "_search")
+
+    def __init__(self, bibstr: str):
+        self.bibstr = bibstr
+        self.pos = 0
+        self._search = _MARK_RE.search
+
+    def next(self) -> Optional[_Mark]:
+        """Return the next mark after the current position, or None at end of string."""
+        m = self._search(self.bibstr, self.pos)
+        if m is None:
+            return None
+        self.pos = end = m.end()
+        return m.group(0), m.start(), end
+
 
 class Splitter:
     """Object responsible for splitting a BibTeX string into blocks.
@@ -32,17 +82,35 @@ class Splitter:
     This allows for maximum flexibility in the parsing process,
     by subsequently applying middleware."""
 
+    # The splitter state is accessed for every single mark;
+    #   slots make these attribute accesses cheaper than dict lookups.
+    __slots__ = (
+        "bibstr",
+        "_scanner",
+        "_unaccepted_mark",
+        "_current_line",
+        "_line_counted_index",
+        "_current_char_index",
+        "_open_brackets",
+        "_is_quote_open",
+        "_expected_next",
+        "_implicit_comment_start_line",
+        "_implicit_comment_start",
+    )
+
     def __init__(self, bibstr: str):
         # Add a newline at the beginning to simplify parsing
         #   (we only allow "@"-block starts after a newline)
         self.bibstr = f"\n{bibstr}"
 
-        self._markiter = None
+        self._scanner = None
         self._unaccepted_mark = None
 
         # Keep track of line we're currently looking at.
         #   `-1` compensates for manually added `\n` above
         self._current_line = -1
+        # Index up to which newlines have been counted into `_current_line`
+        self._line_counted_index = 0
 
         self._reset_block_status(current_char_index=0)
 
@@ -65,15 +133,9 @@ class Splitter:
 
         # Clear leading and trailing empty lines,
         #   and count how many lines were removed, to adapt start_line below
-        leading_empty_lines = 0
-        i = 0
-        for i, char in enumerate(comment):
-            if char == "\n":
-                leading_empty_lines += 1
-            elif not char.isspace():
-                break
-
-        comment = comment[i:].rstrip()
+        stripped = comment.lstrip()
+        leading_empty_lines = comment.count("\n", 0, len(comment) - len(stripped))
+        comment = stripped.rstrip()
 
         if len(comment) > 0:
             return ImplicitComment(
@@ -84,51 +146,82 @@ class Splitter:
         else:
             return None
 
-    def _next_mark(self, accept_eof: bool) -> Optional[re.Match]:
+    def _next_mark(self, accept_eof: bool) -> Optional[_Mark]:
         # Check if there is a mark that was previously not consumed
         #   and return it if so
-        if self._unaccepted_mark is not None:
-            m = self._unaccepted_mark
+        m = self._unaccepted_mark
+        if m is not None:
             self._unaccepted_mark = None
-            self._current_char_index = m.start()
+            self._current_char_index = m[1]
             return m
 
-        # Get next mark from iterator
-        m = next(self._markiter, None)
-        if m is not None:
-            self._current_char_index = m.start()
-            if m.group(0) == "\n":
-                self._current_line += 1
-                return self._next_mark(accept_eof=accept_eof)
-        else:
-            # Reached end of file
-            self._current_char_index = len(self.bibstr)
-            if not accept_eof:
-                raise BlockAbortedException(
-                    abort_reason="Unexpectedly reached end of file.",
-                    end_index=self._current_char_index,
-                )
+        # Get next mark from scanner (`None` if we reached the end of file)
+        m = self._scanner.next()
+        index = len(self.bibstr) if m is None else m[1]
+
+        # Newlines are not marks; count the ones we skipped over in one go
+        self._current_line += self.bibstr.count("\n", self._line_counted_index, index)
+        self._line_counted_index = index
+        self._current_char_index = index
+
+        if m is None and not accept_eof:
+            raise BlockAbortedException(
+                abort_reason="Unexpectedly reached end of file.",
+                end_index=index,
+            )
         return m
 
-    def _move_to_closed_bracket(self) -> int:
-        """Index of the curly bracket closing a just opened one."""
+    def _move_to_closed_bracket(self) -> Tuple[int, Optional[str]]:
+        """Index of the curly bracket closing a just opened one.
+
+        If a new block starts before the bracket is closed, the index before the new block
+        is returned, together with the reason why the current block has to be aborted.
+        Otherwise, the returned abort reason is None."""
+        # Only brackets and block starts are relevant here. Hence, instead of iterating
+        #   over all marks, we directly look for the next `{`, `}` and `@`,
+        #   and keep these positions until we moved past them.
+        s = self.bibstr
+        pos = self._scanner.pos
+        next_open = _find(s, "{", pos)
+        next_close = _find(s, "}", pos)
+        next_at = _find(s, "@", pos)
+
         num_additional_brackets = 0
         while True:
-            m = self._next_mark(accept_eof=False)
-            if m.group(0) == "{":
-                num_additional_brackets += 1
-            elif m.group(0) == "}":
-                if num_additional_brackets == 0:
-                    return m.start()
-                else:
+            index = min(next_open, next_close, next_at)
+            if index == len(s):
+                self._skip_marks_until(index, index)
+                return index, "Unexpectedly reached end of file."
+
+            if index == next_at:
+                next_at = _find(s, "@", index + 1)
+                block_start = _BLOCK_START_RE.match(s, index)
+                if block_start is not None:
+                    self._skip_marks_until(index, block_start.end())
+                    self._unaccepted_mark = (block_start.group(0), index, block_start.end())
+                    return (
+                        index - 1,
+                        f"Unexpected block start: `{block_start.group(0)}`. "
+                        f"Was still looking for closing bracket",
+                    )
+            elif index == next_open:
+                next_open = _find(s, "{", index + 1)
+                if s[index - 1] != "\\":
+                    num_additional_brackets += 1
+            else:
+                next_close = _find(s, "}", index + 1)
+                if s[index - 1] != "\\":
+                    if num_additional_brackets == 0:
+                        self._skip_marks_until(index, index + 1)
+                        return index, None
                     num_additional_brackets -= 1
-            elif m.group(0).startswith("@"):
-                self._unaccepted_mark = m
-                raise BlockAbortedException(
-                    abort_reason=f"Unexpected block start: `{m.group(0)}`. "
-                    f"Was still looking for closing bracket",
-                    end_index=m.start() - 1,
-                )
+
+    def _skip_marks_until(self, index: int, scanner_pos: int):
+        """Move to `index` without consuming marks, and continue scanning at `scanner_pos`."""
+        self._current_line += self.bibstr.count("\n", self._line_counted_index, index)
+        self._line_counted_index = index
+        self._current_char_index = index
+        self._scanner.pos = scanner_pos
 
     def _move_to_comma_or_closing_curly_bracket(
         self, currently_quote_escaped=False, num_open_curls=0
@@ -142,35 +235,37 @@ class Splitter:
                 "Please report this bug."
             )
 
-        def _is_escaped():
-            return currently_quote_escaped or num_open_curls > 0
-
-        # iterate over marks until we find end of field
+        # Iterate over marks until we find end of field.
+        #   The value is either curly-escaped (`num_open_curls > 0`),
+        #   quote-escaped, or not escaped, and only few marks change this state.
         while True:
             next_mark = self._next_mark(accept_eof=False)
-
-            # Handle "escape" characters
-            if next_mark.group(0) == '"' and not num_open_curls > 0:
-                currently_quote_escaped = not currently_quote_escaped
+            mark = next_mark[0]
+
+            if num_open_curls > 0:
+                if mark == "{":
+                    num_open_curls += 1
+                    continue
+                elif mark == "}":
+                    num_open_curls -= 1
+                    continue
+            elif currently_quote_escaped:
+                if mark == '"':
+                    currently_quote_escaped = False
+                    continue
+            elif mark == '"':
+                currently_quote_escaped = True
                 continue
-            elif next_mark.group(0) == "{" and not currently_quote_escaped:
+            elif mark == "{":
                 num_open_curls += 1
                 continue
-            elif next_mark.group(0) == "}" and not currently_quote_escaped and num_open_curls > 0:
-                num_open_curls -= 1
-                continue
-
-            # Check for end of field
-            elif next_mark.group(0) == "," and not _is_escaped():
-                self._unaccepted_mark = next_mark
-                return next_mark.start()
-            # Check for end of entry:
-            elif next_mark.group(0) == "}" and not _is_escaped():
+            elif mark == "," or mark == "}":
+                # End of field (`,`) or end of entry (`}`)
                 self._unaccepted_mark = next_mark
-                return next_mark.start()
+                return next_mark[1]
 
             # Sanity-check: If new block is starting, we abort
-            elif next_mark.group(0).startswith("@"):
+            if mark[0] == "@":
                 self._unaccepted_mark = next_mark
 
                 if currently_quote_escaped:
@@ -181,9 +276,9 @@ class Splitter:
                     looking_for = "`,` or `}`"
 
                 raise BlockAbortedException(
-                    abort_reason=f"Unexpected block start: `{next_mark.group(0)}`. "
+                    abort_reason=f"Unexpected block start: `{mark}`. "
                     f"Was still looking for field-value closing {looking_for} ",
-                    end_index=next_mark.start() - 1,
+                    end_index=next_mark[1] - 1,
                 )
 
     def _move_to_end_of_entry(self, first_key_start: int) -> Tuple[List[Field], int, Set[str]]:
@@ -195,23 +290,23 @@ class Splitter:
         key_start = first_key_start
         while True:
             equals_mark = self._next_mark(accept_eof=False)
-            if equals_mark.group(0) == "}":
+            if equals_mark[0] == "}":
                 # End of entry
-                return result, equals_mark.end(), duplicate_keys
+                return result, equals_mark[2], duplicate_keys
 
-            if equals_mark.group(0) != "=":
+            if equals_mark[0] != "=":
                 self._unaccepted_mark = equals_mark
                 raise BlockAbortedException(
                     abort_reason="Expected a `=` after entry key, "
-                    f"but found `{equals_mark.group(0)}`.",
-                    end_index=equals_mark.start(),
+                    f"but found `{equals_mark[0]}`.",
+                    end_index=equals_mark[1],
                 )
 
             # We follow the convention that the field start line
             #   is where the `=` between key and value is.
             start_line = self._current_line
-            key_end = equals_mark.start()
-            value_start = equals_mark.end()
+            key_end = equals_mark[1]
+            value_start = equals_mark[2]
             value_end = self._move_to_comma_or_closing_curly_bracket(
                 currently_quote_escaped=False, num_open_curls=0
             )
@@ -227,9 +322,9 @@ class Splitter:
 
             # If next mark is a comma, continue
             after_field_mark = self._next_mark(accept_eof=False)
-            if after_field_mark.group(0) == ",":
-                key_start = after_field_mark.end()
-            elif after_field_mark.group(0) == "}":
+            if after_field_mark[0] == ",":
+                key_start = after_field_mark[2]
+            elif after_field_mark[0] == "}":
                 # If next mark is a closing bracket, put it back (will return in next loop iteration)
                 self._unaccepted_mark = after_field_mark
                 continue
@@ -237,8 +332,8 @@ class Splitter:
                 self._unaccepted_mark = after_field_mark
                 raise BlockAbortedException(
                     abort_reason="Expected either a `,` or `}` after a closed entry field value, "
-                    f"but found a {after_field_mark.group(0)} before.",
-                    end_index=after_field_mark.start(),
+                    f"but found a {after_field_mark[0]} before.",
+                    end_index=after_field_mark[1],
                 )
 
     def split(self, library: Optional[Library] = None) -> Library:
@@ -249,9 +344,7 @@ class Splitter:
         Returns:
             The library with the added blocks.
         """
-        self._markiter = re.finditer(
-            r"(?<!\\)[\{\}\",=\n]|@[\w]*( |\t)*(?={)", self.bibstr, re.MULTILINE
-        )
+        self._scanner = _MarkScanner(self.bibstr)
 
         if library is None:
             library = Library()
@@ -263,11 +356,12 @@ class Splitter:
             if m is None:
                 break
 
-            m_val = m.group(0).lower()
-
-            if m_val.startswith("@"):
+            if m[0][0] == "@":
+                m_val = m[0].lower()
+                # The block type, e.g. `article` for `@Article {`
+                block_type = m_val[1:].rstrip()
                 # Clean up previous block implicit_comment
-                implicit_comment = self._end_implicit_comment(m.start())
+                implicit_comment = self._end_implicit_comment(m[1])
                 if implicit_comment is not None:
                     library.add(implicit_comment)
                 self._implicit_comment_start = None
@@ -275,14 +369,11 @@ class Splitter:
                 start_line = self._current_line
                 try:
                     # Start new block parsing
-                    if m_val.startswith("@comment"):
-                        library.add(self._handle_explicit_comment())
-                    elif m_val.startswith("@preamble"):
-                        library.add(self._handle_preamble())
-                    elif m_val.startswith("@string"):
-                        library.add(self._handle_string(m))
+                    handler = _BLOCK_HANDLERS.get(block_type)
+                    if handler is not None:
+                        library.add(getattr(self, handler)())
                     else:
-                        library.add(self._handle_entry(m, m_val))
+                        library.add(self._handle_entry(m, block_type))
 
                 except BlockAbortedException as e:
                     logger.warning(
@@ -297,7 +388,7 @@ class Splitter:
                     library.add(
                         ParsingFailedBlock(
                             start_line=start_line,
-                            raw=self.bibstr[m.start() : e.end_index],
+                            raw=self.bibstr[m[1] : e.end_index],
                             error=e,
                         )
                     )
@@ -335,28 +426,29 @@ class Splitter:
         start_index = self._current_char_index
         start_line = self._current_line
         start_bracket_mark = self._next_mark(accept_eof=False)
-        if start_bracket_mark.group(0) != "{":
+        if start_bracket_mark[0] != "{":
             self._unaccepted_mark = start_bracket_mark
             # Note: The following should never happen, as we check for the "{" in the regex
             raise RegexMismatchException(
                 first_match="@comment{",
                 expected_match="{",
-                second_match=start_bracket_mark.group(0),
+                second_match=start_bracket_mark[0],
             )
-        end_bracket_index = self._move_to_closed_bracket()
-        comment_str = self.bibstr[start_bracket_mark.end() : end_bracket_index].strip()
+        end_bracket_index, abort_reason = self._move_to_closed_bracket()
+        if abort_reason is not None:
+            raise BlockAbortedException(abort_reason=abort_reason, end_index=end_bracket_index)
+        comment_str = self.bibstr[start_bracket_mark[2] : end_bracket_index].strip()
         return ExplicitComment(
             start_line=start_line,
             comment=comment_str,
             raw=self.bibstr[start_index : end_bracket_index + 1],
         )
 
-    def _handle_entry(self, m, m_val) -> Union[Entry, ParsingFailedBlock]:
+    def _handle_entry(self, m, entry_type) -> Union[Entry, ParsingFailedBlock]:
         """Handle entry block. Return end index"""
         start_line = self._current_line
-        entry_type = m_val[1:].strip()
         start_bracket_mark = self._next_mark(accept_eof=False)
-        if start_bracket_mark.group(0) != "{":
+        if start_bracket_mark[0] != "{":
             self._unaccepted_mark = start_bracket_mark
             # Note: The following should never happen, as we check for the "{" in the regex
             raise ParserStateException(
@@ -365,28 +457,28 @@ class Splitter:
                 "but no closing bracket was found."
             )
         comma_mark = self._next_mark(accept_eof=False)
-        if comma_mark.group(0) == "}":
+        if comma_mark[0] == "}":
             # This is an entry without any comma after the key, and with no fields
             #   Used e.g. by RefTeX (see issue #384)
-            key = self.bibstr[m.end() + 1 : comma_mark.start()].strip()
-            fields, end_index, duplicate_keys = [], comma_mark.end(), []
-        elif comma_mark.group(0) != ",":
+            key = self.bibstr[m[2] + 1 : comma_mark[1]].strip()
+            fields, end_index, duplicate_keys = [], comma_mark[2], []
+        elif comma_mark[0] != ",":
             self._unaccepted_mark = comma_mark
             raise BlockAbortedException(
-                abort_reason=f"Expected comma after entry key, but found {comma_mark.group(0)}",
-                end_index=comma_mark.end(),
+                abort_reason=f"Expected comma after entry key, but found {comma_mark[0]}",
+                end_index=comma_mark[2],
             )
         else:
             self._open_brackets += 1
-            key = self.bibstr[m.end() + 1 : comma_mark.start()].strip()
-            fields, end_index, duplicate_keys = self._move_to_end_of_entry(comma_mark.end())
+            key = self.bibstr[m[2] + 1 : comma_mark[1]].strip()
+            fields, end_index, duplicate_keys = self._move_to_end_of_entry(comma_mark[2])
 
         entry = Entry(
             start_line=start_line,
             entry_type=entry_type,
             key=key,
             fields=fields,
-            raw=self.bibstr[m.start() : end_index],
+            raw=self.bibstr[m[1] : end_index],
         )
 
         # If there were duplicate field keys, we return a DuplicateFieldKeyBlock wrapping
@@ -395,13 +487,13 @@ class Splitter:
         else:
             return entry
 
-    def _handle_string(self, m) -> String:
+    def _handle_string(self) -> String:
         """Handle string block. Return end index"""
         # Get next mark, which should be an equals sign
         start_i = self._current_char_index
         start_line = self._current_line
         start_bracket_mark = self._next_mark(accept_eof=False)
-        if start_bracket_mark.group(0) != "{":
+        if start_bracket_mark[0] != "{":
             self._unaccepted_mark = start_bracket_mark
             # Note: The following should never happen, as we check for the "{" in the regex
             raise ParserStateException(
@@ -409,16 +501,17 @@ class Splitter:
                 "should end with `{`, but no closing bracket was found."
             )
         equals_mark = self._next_mark(accept_eof=False)
-        if equals_mark.group(0) != "=":
+        if equals_mark[0] != "=":
             self._unaccepted_mark = equals_mark
             raise BlockAbortedException(
-                abort_reason="Expected equals sign after field key,"
-                f" but found {equals_mark.group(0)}",
-                end_index=equals_mark.end(),
+                abort_reason=f"Expected equals sign after field key, but found {equals_mark[0]}",
+                end_index=equals_mark[2],
             )
-        key = self.bibstr[m.end() + 1 : equals_mark.start()].strip()
-        value_start = equals_mark.end()
-        end_i = self._move_to_closed_bracket()
+        key = self.bibstr[start_bracket_mark[2] : equals_mark[1]].strip()
+        value_start = equals_mark[2]
+        end_i, abort_reason = self._move_to_closed_bracket()
+        if abort_reason is not None:
+            raise BlockAbortedException(abort_reason=abort_reason, end_index=end_i)
         value = self.bibstr[value_start:end_i].strip()
         return String(
             start_line=start_line,
@@ -432,7 +525,7 @@ class Splitter:
         start_i = self._current_char_index
         start_line = self._current_line
         start_bracket_mark = self._next_mark(accept_eof=False)
-        if start_bracket_mark.group(0) != "{":
+        if start_bracket_mark[0] != "{":
             self._unaccepted_mark = start_bracket_mark
             # Note: The following should never happen, as we check for the "{" in the regex
             raise ParserStateException(
@@ -440,8 +533,10 @@ class Splitter:
                 "should end with `{`, but no closing bracket was found."
             )
 
-        end_bracket_index = self._move_to_closed_bracket()
-        preamble = self.bibstr[start_bracket_mark.end() : end_bracket_index]
+        end_bracket_index, abort_reason = self._move_to_closed_bracket()
+        if abort_reason is not None:
+            raise BlockAbortedException(abort_reason=abort_reason, end_index=end_bracket_index)
+        preamble = self.bibstr[start_bracket_mark[2] : end_bracket_index]
         return Preamble(
             start_line=start_line,
             value=preamble,
@@ -393,3 +393,20 @@ def test_blocks_not_starting_on_new_lines(expected: Dict[str, Any]):
     assert entry.entry_type == expected["type"]
     assert entry.raw == expected["raw"]
     assert entry.start_line == expected["start_line"]
+
+
+def test_start_line_after_backslash_at_end_of_line():
+    """Newlines preceded by a backslash must still be counted for `start_line`."""
+    bibtex_str = (
+        "@article{first,\n"
+        "  title = {Ends with a backslash \\\\\n"
+        "           and continues here}\n"
+        "}\n"
+        "\n"
+        "@article{second,\n"
+        "  title = {Second}\n"
+        "}\n"
+    )
+    library: Library = Splitter(bibtex_str).split()
+    assert [e.start_line for e in library.entries] == [0, 5]
+    assert library.entries[1].fields[0].start_line == 6
@@ -65,6 +65,9 @@ def test_field_enclosings(field_key: str, value: str, line: int):
         ("@inproceedings", "inproceedings"),
         ("@INPROCEEDINGS", "inproceedings"),
         ("@InprocEEdings", "inproceedings"),
+        # Only exact matches of `comment`, `preamble` and `string` are special blocks
+        ("@Commentary", "commentary"),
+        ("@stringent", "stringent"),
     ],
 )
 def test_entry_type(declared_block_type, expected):
@@ -1,5 +1,7 @@
 from copy import copy
 from copy import deepcopy
+from pickle import dumps
+from pickle import loads
 from textwrap import dedent
 
 import pytest
@@ -76,6 +78,16 @@ def test_entry_deepcopy():
     assert entry_1.fields_dict["field"] == entry_2.fields_dict["field"]
 
 
+@pytest.mark.parametrize("protocol", [0, 2, 4])
+def test_entry_pickle(protocol: int):
+    entry = Entry("article", "key", [Field("field", "value", 1)], 1, "raw")
+    entry.set_parser_metadata("foo", "bar")
+    unpickled = loads(dumps(entry, protocol=protocol))
+    assert unpickled == entry
+    assert unpickled.fields[0] == Field("field", "value", 1)
+    assert unpickled.get_parser_metadata("foo") == "bar"
+
+
 def test_entry_get():
     entry1 = Entry("article", "key", [Field("field", "value", 1), Field("foo", "bar", 2)], 1, "raw")
     entry2 = Entry("article", "key", [Field("field", "value", 1), Field("foo", "bar", 2)], 1, "raw")
@@ -92,6 +104,13 @@ def test_entry_pop():
     assert entry1 == entry2
 
 
+def test_entry_set_field():
+    entry = Entry("article", "key", [Field("field", "value", 1), Field("foo", "bar", 2)], 1, "raw")
+    entry.set_field(Field("foo", "baz"))
+    entry.set_field(Field("new", "value"))
+    assert entry.fields == [Field("field", "value", 1), Field("foo", "baz"), Field("new", "value")]
+
+
 def test_entry_contains():
     entry = Entry("article", "key", [Field("field", "value", 1)], 1, "raw")
     assert "field" in entry